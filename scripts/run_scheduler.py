@@ -55,6 +55,7 @@ class SchedulerDaemon:
             logger.info("Shutting down scheduler...")
             if self.scheduler:
                 self.scheduler.shutdown(wait=True)
+                await self.scheduler.close()
             logger.info("Scheduler stopped cleanly")
 
 
@@ -1,9 +1,22 @@
 """Environment-driven settings for signal collection, demo trading, and scheduling."""
 
-from pydantic import model_validator
+from functools import cached_property
+
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _parse_hhmm(value: str) -> tuple[int, int]:
+    try:
+        hour, minute = value.split(":", maxsplit=1)
+        parsed = int(hour), int(minute)
+    except ValueError:
+        raise ValueError(f"expected HH:MM, got {value!r}") from None
+    if not (0 <= parsed[0] < 24 and 0 <= parsed[1] < 60):
+        raise ValueError(f"expected HH:MM, got {value!r}")
+    return parsed
+
+
 class Settings(BaseSettings):
     """Validated runtime configuration loaded from environment variables and `.env`."""
 
@@ -14,6 +27,7 @@ class Settings(BaseSettings):
 
     # Data sources (all optional — bot degrades gracefully if missing)
     news_api_key: str = ""
+    news_max_concurrency: int = Field(default=5, ge=1)  # concurrent NewsAPI calls in enrichment
     fmp_api_key: str = ""
 
     # Broker — Practice / Demo only (single account)
@@ -63,6 +77,20 @@ class Settings(BaseSettings):
     max_tool_rounds: int = 10
     pipeline_timeout_seconds: int = 900
 
+    @field_validator("scheduler_execute_time", "scheduler_eod_time")
+    @classmethod
+    def validate_schedule_time(cls, value: str) -> str:
+        _parse_hhmm(value.strip())
+        return value
+
+    @field_validator("scheduler_snapshot_times")
+    @classmethod
+    def validate_snapshot_times(cls, value: str) -> str:
+        for part in value.split(","):
+            if part.strip():
+                _parse_hhmm(part.strip())
+        return value
+
     @model_validator(mode="after")
     def validate_credentials(self) -> "Settings":
         if not self.t212_api_key.strip():
@@ -71,6 +99,20 @@ class Settings(BaseSettings):
             )
         return self
 
+    @cached_property
+    def execute_time_parsed(self) -> tuple[int, int]:
+        return _parse_hhmm(self.scheduler_execute_time)
+
+    @cached_property
+    def eod_time_parsed(self) -> tuple[int, int]:
+        return _parse_hhmm(self.scheduler_eod_time)
+
+    @cached_property
+    def snapshot_times_parsed(self) -> tuple[tuple[int, int], ...]:
+        return tuple(
+            _parse_hhmm(t.strip()) for t in self.scheduler_snapshot_times.split(",") if t.strip()
+        )
+
 
 def get_settings() -> Settings:
     """Load and validate the current process configuration."""
@@ -1,4 +1,5 @@
 import asyncio
+import heapq
 import logging
 import math
 import time
@@ -258,4 +259,4 @@ async def get_politician_candidates(
         len(raw),
         len(candidates),
     )
-    return sorted(candidates, key=lambda x: x["conviction_score"], reverse=True)[:top_n]
+    return heapq.nlargest(top_n, candidates, key=lambda x: x["conviction_score"])
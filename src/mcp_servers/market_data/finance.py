@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 import yfinance as yf
@@ -13,6 +13,14 @@ EU_SUFFIXES: dict[str, str] = {
     "L": "London Stock Exchange",
 }
 
+# Trailing windows carved out of one 1y history: returns use 1m/6m/1y, technicals use 6m
+_RETURN_WINDOWS = {
+    "return_1m": timedelta(days=30),
+    "return_6m": timedelta(days=182),
+    "return_1y": timedelta(days=365),
+}
+_TECHNICALS_WINDOW = timedelta(days=182)
+
 CET = ZoneInfo("Europe/Berlin")
 MARKET_OPEN = time(9, 0)
 MARKET_CLOSE = time(17, 30)
@@ -55,27 +63,6 @@ async def get_ticker_info(ticker: str) -> dict:
     return await asyncio.to_thread(_fetch)
 
 
-async def get_price_return_pct(ticker: str, period: str = "1mo") -> float | None:
-    """Return the price return as a decimal (e.g. -0.18 for -18%) over the given period.
-    Returns None if data is unavailable."""
-
-    def _fetch():
-        try:
-            t = yf.Ticker(ticker)
-            df = t.history(period=period)
-            if df.empty or len(df) < 2:
-                return None
-            start = float(df["Close"].iloc[0])
-            end = float(df["Close"].iloc[-1])
-            if start <= 0:
-                return None
-            return round((end - start) / start, 4)
-        except Exception:
-            return None
-
-    return await asyncio.to_thread(_fetch)
-
-
 async def get_ticker_history(ticker: str, period: str = "1mo") -> list[dict]:
     def _fetch():
         t = yf.Ticker(ticker)
@@ -214,7 +201,66 @@ async def get_technical_indicators_for_ticker(ticker: str) -> dict:
     if not history:
         return {"ticker": ticker, "error": "No historical data available"}
 
-    closes = [row["close"] for row in history]
+    return _technicals_from_closes(ticker, [row["close"] for row in history])
+
+
+async def get_price_returns_for_ticker(ticker: str) -> dict:
+    """Return 1m/6m/1y price returns from one 1y history download.
+
+    Returns {"return_1m", "return_6m", "return_1y"} as decimals (e.g. -0.18 for -18%) or None.
+    """
+    df = await _get_year_history(ticker)
+    if df is None:
+        return dict.fromkeys(_RETURN_WINDOWS)
+    return _returns_from_history(df)
+
+
+async def get_price_snapshot(ticker: str) -> dict:
+    """Return 1m/6m/1y price returns plus technical indicators from one 1y history download.
+
+    Returns {"returns": {"return_1m", "return_6m", "return_1y"}, "technicals": {...}}, with
+    returns as decimals (e.g. -0.18 for -18%) or None, and technicals computed on the last 6m.
+    """
+    df = await _get_year_history(ticker)
+    if df is None:
+        return {
+            "returns": dict.fromkeys(_RETURN_WINDOWS),
+            "technicals": {"ticker": ticker, "error": "No historical data available"},
+        }
+
+    days = df.index.normalize()
+    recent = df["Close"][days >= (days[-1] - _TECHNICALS_WINDOW).normalize()]
+    closes_6m = [round(float(c), 4) for c in recent]
+    return {
+        "returns": _returns_from_history(df),
+        "technicals": _technicals_from_closes(ticker, closes_6m),
+    }
+
+
+async def _get_year_history(ticker: str):
+    def _fetch():
+        try:
+            df = yf.Ticker(ticker).history(period="1y")
+        except Exception:
+            return None
+        return None if df.empty else df
+
+    return await asyncio.to_thread(_fetch)
+
+
+def _returns_from_history(df) -> dict[str, float | None]:
+    # Compare calendar days so a DST change inside the window doesn't shift the cutoff
+    days = df.index.normalize()
+    last = days[-1]
+    returns: dict[str, float | None] = {}
+    for key, window in _RETURN_WINDOWS.items():
+        closes = df["Close"][days >= (last - window).normalize()]
+        start = float(closes.iloc[0]) if len(closes) >= 2 else 0.0
+        returns[key] = round((float(closes.iloc[-1]) - start) / start, 4) if start > 0 else None
+    return returns
+
+
+def _technicals_from_closes(ticker: str, closes: list[float]) -> dict:
     return {
         "ticker": ticker,
         "data_points": len(closes),
@@ -1,7 +1,9 @@
 import asyncio
+import heapq
 import logging
 import math
 from collections import defaultdict
+from contextlib import nullcontext
 from datetime import date, datetime
 
 import httpx
@@ -262,25 +264,36 @@ async def get_insider_candidates(
             }
         )
 
-    return sorted(candidates, key=lambda x: x["conviction_score"], reverse=True)[:top_n]
+    return heapq.nlargest(top_n, candidates, key=lambda x: x["conviction_score"])
 
 
-async def get_ticker_insider_history(ticker: str, days: int = 90) -> dict:
+def make_history_client() -> httpx.Client:
+    """Client for a batch of get_ticker_insider_history calls; the caller closes it.
+
+    httpx.Client is thread-safe, so concurrent history scrapes can share its connections.
+    """
+    return httpx.Client(
+        headers={"User-Agent": "Mozilla/5.0 (compatible; trading-bot/1.0)"},
+        timeout=15.0,
+        follow_redirects=True,
+    )
+
+
+async def get_ticker_insider_history(
+    ticker: str, days: int = 90, client: httpx.Client | None = None
+) -> dict:
     """
     Scrape openinsider.com/TICKER for the historical buy pattern of a specific stock.
 
     Returns buy counts in the last 30 / 60 / 90 days and whether buying is
     accelerating (more recent buys than older ones — accumulation pattern).
+    Pass a client from make_history_client() to reuse connections across tickers.
     """
 
     def _fetch() -> dict:
         try:
-            resp = httpx.get(
-                f"http://openinsider.com/{ticker}",
-                headers={"User-Agent": "Mozilla/5.0 (compatible; trading-bot/1.0)"},
-                timeout=15.0,
-                follow_redirects=True,
-            )
+            with make_history_client() if client is None else nullcontext(client) as http:
+                resp = http.get(f"http://openinsider.com/{ticker}")
             resp.raise_for_status()
 
             soup = BeautifulSoup(resp.text, "lxml")
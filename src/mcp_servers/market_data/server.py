@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import sys
 
@@ -8,7 +7,7 @@ from src.config import get_settings
 from src.mcp_servers.market_data.earnings import get_earnings_revisions
 from src.mcp_servers.market_data.finance import (
     get_earnings_calendar_upcoming,
-    get_price_return_pct,
+    get_price_returns_for_ticker,
     get_technical_indicators_for_ticker,
     get_ticker_earnings,
     get_ticker_fundamentals,
@@ -183,17 +182,8 @@ async def get_price_returns(ticker: str) -> dict:
     Returns decimal values (e.g. -0.18 = -18%). Useful for identifying dip-buy
     opportunities where insiders are accumulating during a price decline."""
     try:
-        r1m, r6m, r1y = await asyncio.gather(
-            get_price_return_pct(ticker, "1mo"),
-            get_price_return_pct(ticker, "6mo"),
-            get_price_return_pct(ticker, "1y"),
-        )
-        return {
-            "ticker": ticker,
-            "return_1m": r1m,
-            "return_6m": r6m,
-            "return_1y": r1y,
-        }
+        returns = await get_price_returns_for_ticker(ticker)
+        return {"ticker": ticker, **returns}
     except Exception as e:
         logger.exception("get_price_returns failed for %s", ticker)
         return {"error": str(e), "ticker": ticker}
@@ -51,6 +51,7 @@ class T212Client:
             timeout=30.0,
         )
         self._instruments_cache: list[dict] | None = None
+        self._instrument_symbols: set[str] = set()
         self._instruments_lock: asyncio.Lock = asyncio.Lock()
         self._resolved_ticker_cache: dict[str, str | None] = {}
 
@@ -148,8 +149,19 @@ class T212Client:
                 return self._instruments_cache
             instruments = await self._request("GET", "/equity/metadata/instruments")
             self._instruments_cache = instruments if isinstance(instruments, list) else []
+            self._instrument_symbols = self._collect_symbols(self._instruments_cache)
         return self._instruments_cache
 
+    @staticmethod
+    def _collect_symbols(instruments: list[dict]) -> set[str]:
+        symbols: set[str] = set()
+        for instrument in instruments:
+            for key in ("ticker", "symbol", "instrumentCode", "code"):
+                value = instrument.get(key)
+                if isinstance(value, str) and value:
+                    symbols.add(value.upper())
+        return symbols
+
     async def resolve_ticker(self, ticker: str) -> str | None:
         normalized = ticker.strip().upper()
         if not normalized:
@@ -159,13 +171,9 @@ class T212Client:
         if normalized in self._resolved_ticker_cache:
             return self._resolved_ticker_cache[normalized]
 
+        # Symbol set is built once per instruments download, not per lookup
         instruments = await self.get_instruments()
-        symbols: set[str] = set()
-        for instrument in instruments:
-            for key in ("ticker", "symbol", "instrumentCode", "code"):
-                value = instrument.get(key)
-                if isinstance(value, str) and value:
-                    symbols.add(value.upper())
+        symbols = self._instrument_symbols
 
         # Step 1: Exact candidate matching (most reliable)
         candidates = self._build_candidates(normalized)
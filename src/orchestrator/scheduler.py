@@ -1,13 +1,16 @@
 """Schedule decision cycles, end-of-day reports, and dashboard snapshots."""
 
+import asyncio
 import logging
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
 
 from src.config import Settings, get_settings
+from src.orchestrator.rotation import is_trading_day
 from src.orchestrator.supervisor import Supervisor
 from src.reporting.daily_report import generate_daily_report, write_daily_report
 
@@ -24,30 +27,36 @@ def _attach_daily_log_handler(run_date: date) -> logging.FileHandler:
     return handler
 
 
-def _parse_hhmm(value: str) -> tuple[int, int]:
-    hour, minute = value.split(":", maxsplit=1)
-    return int(hour), int(minute)
-
-
 class OrchestratorScheduler:
     """Configure and run the experiment's APScheduler jobs."""
 
     def __init__(self, supervisor: Supervisor | None = None, settings: Settings | None = None):
         self._settings = settings or get_settings()
         self._supervisor = supervisor or Supervisor(settings=self._settings)
-        timezone = ZoneInfo(self._settings.orchestrator_timezone)
+        self._tz = ZoneInfo(self._settings.orchestrator_timezone)
         self._scheduler = AsyncIOScheduler(
-            timezone=timezone,
+            timezone=self._tz,
             job_defaults={
                 "coalesce": True,
                 "max_instances": 1,
-                "misfire_grace_time": 300,
             },
         )
         self._last_decision_result: dict | None = None
+        self._report_paths: dict[date, Path] = {}
+
+    def _today(self) -> date:
+        return datetime.now(self._tz).date()
+
+    def _is_trading_day(self) -> bool:
+        if is_trading_day(self._today()):
+            return True
+        logger.info("Not a trading day — skipping job")
+        return False
 
     async def _run_decision_job(self) -> None:
-        run_date = date.today()
+        if not self._is_trading_day():
+            return
+        run_date = self._today()
         handler = _attach_daily_log_handler(run_date)
         try:
             result = await self._supervisor.run_decision_cycle()
@@ -59,7 +68,7 @@ class OrchestratorScheduler:
             handler.close()
 
     async def _run_eod_job(self) -> None:
-        run_date = date.today()
+        run_date = self._today()
         handler = _attach_daily_log_handler(run_date)
         try:
             result = await self._supervisor.run_end_of_day()
@@ -68,97 +77,114 @@ class OrchestratorScheduler:
             decision_result = self._last_decision_result or {}
             if result.get("status") == "ok":
                 eod_date = date.fromisoformat(result["date"])
-                try:
-                    report = await generate_daily_report(
-                        run_date=eod_date,
-                        decision_result=decision_result,
-                        eod_result=result,
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._write_report(eod_date, decision_result, result))
+                    tg.create_task(
+                        asyncio.to_thread(self._update_dashboard, decision_result, result)
                     )
-                    path = write_daily_report(report, eod_date)
-                    logger.info("Daily report written to %s", path)
-                except Exception:
-                    logger.exception("Failed to generate daily report")
-
-                try:
-                    from src.reporting.dashboard import push_dashboard_data, update_dashboard_data
-
-                    update_dashboard_data(decision_result=decision_result, eod_result=result)
-                    push_dashboard_data()
-                except Exception:
-                    logger.exception("Failed to update dashboard data")
 
             self._last_decision_result = None
         finally:
             logging.getLogger().removeHandler(handler)
             handler.close()
 
-    async def _run_snapshot_job(self) -> None:
-        logger.info("Running portfolio snapshot job")
+    async def _write_report(self, eod_date: date, decision_result: dict, eod_result: dict) -> None:
+        # A repeated EOD run has no decision result left, so keep the first report of the day
+        written = self._report_paths.get(eod_date)
+        if written is not None and written.exists():
+            logger.info("Daily report for %s already written to %s", eod_date, written)
+            return
         try:
-            from src.mcp_servers.trading.portfolio import get_account_cash, get_demo_positions
-            from src.mcp_servers.trading.t212_client import T212Client
-            from src.reporting.dashboard import push_dashboard_data, refresh_portfolio_snapshot
+            report = await generate_daily_report(
+                run_date=eod_date,
+                decision_result=decision_result,
+                eod_result=eod_result,
+            )
+            path = await asyncio.to_thread(write_daily_report, report, eod_date)
+            self._report_paths[eod_date] = path
+            logger.info("Daily report written to %s", path)
+        except Exception:
+            logger.exception("Failed to generate daily report")
 
-            t212 = T212Client(
-                api_key=self._settings.t212_api_key,
-                api_secret=self._settings.t212_api_secret,
-                use_demo=True,
+    @staticmethod
+    def _update_dashboard(decision_result: dict, eod_result: dict) -> None:
+        try:
+            from src.reporting.dashboard import (
+                DATA_LOCK,
+                push_dashboard_data,
+                update_dashboard_data,
             )
-            try:
-                positions = await get_demo_positions(t212)
-                cash = await get_account_cash(t212)
-            finally:
-                await t212.close()
 
+            with DATA_LOCK:
+                update_dashboard_data(decision_result=decision_result, eod_result=eod_result)
+                push_dashboard_data()
+        except Exception:
+            logger.exception("Failed to update dashboard data")
+
+    @staticmethod
+    def _refresh_dashboard(positions: list[dict], cash: dict) -> None:
+        from src.reporting.dashboard import (
+            DATA_LOCK,
+            push_dashboard_data,
+            refresh_portfolio_snapshot,
+        )
+
+        with DATA_LOCK:
             refresh_portfolio_snapshot(positions, account_cash=cash)
             push_dashboard_data()
+
+    async def _run_snapshot_job(self) -> None:
+        if not self._is_trading_day():
+            return
+        logger.info("Running portfolio snapshot job")
+        try:
+            from src.mcp_servers.trading.portfolio import get_account_cash, get_demo_positions
+
+            t212 = self._supervisor.t212
+            positions, cash = await asyncio.gather(get_demo_positions(t212), get_account_cash(t212))
+
+            await asyncio.to_thread(self._refresh_dashboard, positions, cash)
             logger.info("Portfolio snapshot pushed to dashboard")
         except Exception:
             logger.exception("Portfolio snapshot job failed")
 
+    def _cron(self, day_of_week: str, hour: int | str, minute: int) -> CronTrigger:
+        return CronTrigger(day_of_week=day_of_week, hour=hour, minute=minute, timezone=self._tz)
+
     def configure_jobs(self) -> None:
         if self._scheduler.get_jobs():
             return
 
+        trade_days = self._settings.scheduler_trade_days
+
         # Trade execution — Tuesday and Friday only (busiest filing days)
-        decision_hour, decision_minute = _parse_hhmm(self._settings.scheduler_execute_time)
         self._scheduler.add_job(
             self._run_decision_job,
-            trigger="cron",
+            trigger=self._cron(trade_days, *self._settings.execute_time_parsed),
             id="decision_and_execution",
-            day_of_week=self._settings.scheduler_trade_days,
-            hour=decision_hour,
-            minute=decision_minute,
+            misfire_grace_time=60,  # a late buy near market close is worse than none
             replace_existing=True,
         )
 
         # EOD snapshot + report — same days as trade execution
-        eod_hour, eod_minute = _parse_hhmm(self._settings.scheduler_eod_time)
         self._scheduler.add_job(
             self._run_eod_job,
-            trigger="cron",
+            trigger=self._cron(trade_days, *self._settings.eod_time_parsed),
             id="end_of_day_snapshot",
-            day_of_week=self._settings.scheduler_trade_days,
-            hour=eod_hour,
-            minute=eod_minute,
+            misfire_grace_time=3600,
             replace_existing=True,
         )
 
-        # Lightweight portfolio price-refresh snapshots (Mon–Fri)
-        snapshot_times = [
-            t.strip()
-            for t in self._settings.scheduler_snapshot_times.split(",")
-            if t.strip()
-        ]
-        for i, t in enumerate(snapshot_times):
-            h, m = _parse_hhmm(t)
+        # Lightweight portfolio price-refresh snapshots (Mon–Fri), one job per distinct minute
+        hours_by_minute: dict[int, list[int]] = {}
+        for h, m in self._settings.snapshot_times_parsed:
+            hours_by_minute.setdefault(m, []).append(h)
+        for i, (m, hours) in enumerate(hours_by_minute.items()):
             self._scheduler.add_job(
                 self._run_snapshot_job,
-                trigger="cron",
+                trigger=self._cron("mon-fri", ",".join(map(str, sorted(set(hours)))), m),
                 id=f"portfolio_snapshot_{i}",
-                day_of_week="mon-fri",
-                hour=h,
-                minute=m,
+                misfire_grace_time=120,
                 replace_existing=True,
             )
 
@@ -173,6 +199,9 @@ class OrchestratorScheduler:
             self._scheduler.shutdown(wait=wait)
             logger.info("Orchestrator scheduler stopped")
 
+    async def close(self) -> None:
+        await self._supervisor.close()
+
     @property
     def scheduler(self) -> AsyncIOScheduler:
         return self._scheduler
@@ -1,24 +1,37 @@
 """Coordinate signal collection, enrichment, AI decisions, demo execution, and reports."""
 
 import asyncio
+import heapq
 import logging
 from dataclasses import dataclass
 from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
+from functools import cached_property
 from zoneinfo import ZoneInfo
 
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
 from src.agents.pipeline import AgentPipeline, PipelineOutput
 from src.config import Settings, get_settings
 from src.mcp_servers.market_data.capitol_trades import get_politician_candidates
 from src.mcp_servers.market_data.finance import (
     get_eur_usd_rate,
-    get_price_return_pct,
-    get_technical_indicators_for_ticker,
+    get_price_snapshot,
     get_ticker_earnings,
     get_ticker_fundamentals,
     get_ticker_news,
 )
-from src.mcp_servers.market_data.insider import get_insider_candidates, get_ticker_insider_history
+from src.mcp_servers.market_data.insider import (
+    get_insider_candidates,
+    get_ticker_insider_history,
+    make_history_client,
+)
 from src.mcp_servers.market_data.news import get_company_news
 from src.mcp_servers.trading.portfolio import get_account_cash, get_demo_positions
 from src.mcp_servers.trading.t212_client import T212Client
@@ -36,6 +49,45 @@ from src.utils.recently_traded import get_blacklist
 logger = logging.getLogger(__name__)
 
 
+def _format_totals(total_invested: float, total_value: float, unrealized_pnl: float) -> dict:
+    return {
+        "total_invested": str(round(Decimal(str(total_invested)), 2)),
+        "total_value": str(round(Decimal(str(total_value)), 2)),
+        "unrealized_pnl": str(round(Decimal(str(unrealized_pnl)), 2)),
+    }
+
+
+def _merge_by_ticker(insiders: list[dict], politicians: list[dict]) -> list[dict]:
+    """Tag OpenInsider candidates and fold Capitol Trades buys into them by ticker.
+
+    A ticker found in both sources becomes one combined entry.
+    """
+    merged: dict[str, dict] = {}
+    for c in insiders:
+        c.setdefault("source", "openinsider")
+        merged[c["ticker"]] = c
+
+    for p in politicians:
+        existing = merged.get(p["ticker"])
+        if existing is None:
+            merged[p["ticker"]] = p
+            continue
+        combined_insiders = list(existing.get("insiders", []))
+        for name in p["insiders"]:
+            if name not in combined_insiders:
+                combined_insiders.append(name)
+        merged[p["ticker"]] = {
+            **existing,
+            "source": "openinsider+capitol_trades",
+            "insiders": combined_insiders,
+            "conviction_score": existing["conviction_score"] + p["conviction_score"],
+            "total_value_usd": existing["total_value_usd"] + p["total_value_usd"],
+            "has_politician_buy": True,
+            "politician_names": p["insiders"],
+        }
+    return list(merged.values())
+
+
 @dataclass
 class PipelineResult:
     """Decision-stage artifacts used by downstream reporting and execution."""
@@ -60,7 +112,10 @@ class Supervisor:
         self._market_data_client = market_data_client
         self._notifier = TelegramNotifier(self._settings)
         self._t212: T212Client | None = None
-        self._news_sem = asyncio.Semaphore(5)  # max 5 concurrent NewsAPI calls
+        self._news_sem = asyncio.Semaphore(getattr(self._settings, "news_max_concurrency", 5))
+        self._invested_cap = float(
+            getattr(self._settings, "max_demo_portfolio_invested_eur", 0) or 0
+        )
 
     def _ensure_clients(self) -> None:
         if self._trading_client is None:
@@ -77,12 +132,31 @@ class Supervisor:
             )
         return self._t212
 
+    @property
+    def t212(self) -> T212Client:
+        """Demo T212 client, also used by the scheduler's snapshot job."""
+        return self._get_t212()
+
+    async def close(self) -> None:
+        if self._t212 is not None:
+            await self._t212.close()
+            self._t212 = None
+
+    @cached_property
+    def _tz(self) -> ZoneInfo:
+        return ZoneInfo(self._settings.orchestrator_timezone)
+
+    def _today(self) -> date:
+        return datetime.now(self._tz).date()
+
     def _get_pipeline(self) -> AgentPipeline:
         if self._pipeline is None:
             self._pipeline = AgentPipeline()
         return self._pipeline
 
-    async def _enrich_candidate(self, candidate: dict) -> dict:
+    async def _enrich_candidate(
+        self, candidate: dict, history_client: httpx.Client | None = None
+    ) -> dict:
         """Fetch all enrichment data for a single insider candidate in parallel."""
         ticker = candidate["ticker"]
         company = candidate.get("company", ticker)
@@ -93,22 +167,15 @@ class Supervisor:
             except Exception:
                 return default
 
-        (
-            returns_1m,
-            returns_6m,
-            returns_1y,
-            fundamentals,
-            technicals,
-            earnings,
-            insider_history,
-        ) = await asyncio.gather(
-            _safe(get_price_return_pct(ticker, "1mo"), 0.0),
-            _safe(get_price_return_pct(ticker, "6mo"), 0.0),
-            _safe(get_price_return_pct(ticker, "1y"), 0.0),
+        # One 1y price history covers the 1m/6m/1y returns and the technicals
+        snapshot, fundamentals, earnings, insider_history = await asyncio.gather(
+            _safe(get_price_snapshot(ticker), {}),
             _safe(get_ticker_fundamentals(ticker), {}),
-            _safe(get_technical_indicators_for_ticker(ticker), {}),
             _safe(get_ticker_earnings(ticker), {}),
-            _safe(get_ticker_insider_history(ticker, days=90), {}),
+            _safe(get_ticker_insider_history(ticker, days=90, client=history_client), {}),
+        )
+        returns = snapshot.get("returns") or dict.fromkeys(
+            ("return_1m", "return_6m", "return_1y"), 0.0
         )
 
         # News — try NewsAPI first (rate-limited), fall back to yfinance
@@ -128,13 +195,9 @@ class Supervisor:
 
         return {
             **candidate,
-            "returns": {
-                "return_1m": returns_1m,
-                "return_6m": returns_6m,
-                "return_1y": returns_1y,
-            },
+            "returns": returns,
             "fundamentals": fundamentals,
-            "technicals": technicals,
+            "technicals": snapshot.get("technicals", {}),
             "earnings": earnings,
             "insider_history": insider_history,
             "news": news,
@@ -179,42 +242,17 @@ class Supervisor:
             politician_candidates = []
             logger.info("Got %d insider candidates before enrichment", len(insider_candidates))
 
-        # Tag OpenInsider candidates with source
-        for c in insider_candidates:
-            c.setdefault("source", "openinsider")
-
-        # Merge by ticker — same ticker in both sources becomes a combined entry
-        ticker_to_candidate: dict[str, dict] = {}
-        for c in insider_candidates:
-            ticker_to_candidate[c["ticker"]] = c
-
-        for p in politician_candidates:
-            ticker = p["ticker"]
-            if ticker in ticker_to_candidate:
-                existing = ticker_to_candidate[ticker]
-                combined_insiders = list(existing.get("insiders", []))
-                for name in p["insiders"]:
-                    if name not in combined_insiders:
-                        combined_insiders.append(name)
-                ticker_to_candidate[ticker] = {
-                    **existing,
-                    "source": "openinsider+capitol_trades",
-                    "insiders": combined_insiders,
-                    "conviction_score": existing["conviction_score"] + p["conviction_score"],
-                    "total_value_usd": existing["total_value_usd"] + p["total_value_usd"],
-                    "has_politician_buy": True,
-                    "politician_names": p["insiders"],
-                }
-            else:
-                ticker_to_candidate[ticker] = p
-
-        candidates = list(ticker_to_candidate.values())
+        candidates = _merge_by_ticker(insider_candidates, politician_candidates)
 
         if not candidates:
             return {"candidates": [], "insider_count": 0}
 
         # Parallel enrichment — all candidates simultaneously
-        enriched = await asyncio.gather(*[self._enrich_candidate(c) for c in candidates])
+        # One OpenInsider client per pass so the per-ticker history scrapes share connections
+        with make_history_client() as history_client:
+            enriched = await asyncio.gather(
+                *[self._enrich_candidate(c, history_client) for c in candidates]
+            )
         enriched_list = list(enriched)
 
         # Drop non-equity instruments (mutual funds, ETFs, indices) that slip through
@@ -324,21 +362,18 @@ class Supervisor:
         run_date: date | None = None,
         force: bool = False,
     ) -> dict:
-        run_date = run_date or datetime.now(ZoneInfo(self._settings.orchestrator_timezone)).date()
+        run_date = run_date or self._today()
 
         if not force and not is_trading_day(run_date, self._settings.orchestrator_timezone):
             return {"status": "skipped", "reason": "non-trading-day", "date": str(run_date)}
 
         # Fetch portfolio up front — needed for cap guard and for pipeline context.
         t212 = self._get_t212()
-        try:
-            portfolio = await get_demo_positions(t212)
-        except Exception:
-            logger.exception("Failed to fetch demo positions")
-            portfolio = []
-
-        account_cash = await self._get_account_cash_snapshot(t212)
-        invested_cap = float(getattr(self._settings, "max_demo_portfolio_invested_eur", 0) or 0)
+        portfolio, account_cash = await asyncio.gather(
+            self._get_demo_positions_snapshot(t212),
+            self._get_account_cash_snapshot(t212),
+        )
+        invested_cap = self._invested_cap
         total_invested, total_value, unrealized_pnl = self._resolve_portfolio_totals(
             positions=portfolio,
             account_cash=account_cash,
@@ -356,15 +391,15 @@ class Supervisor:
                     f">= €{invested_cap:.2f}"
                 ),
                 "date": str(run_date),
-                "portfolio": {
-                    "total_invested": str(round(Decimal(str(total_invested)), 2)),
-                    "total_value": str(round(Decimal(str(total_value)), 2)),
-                    "unrealized_pnl": str(round(Decimal(str(unrealized_pnl)), 2)),
-                },
+                "portfolio": _format_totals(total_invested, total_value, unrealized_pnl),
             }
 
-        # Build enriched insider digest
-        digest = await self.build_insider_digest()
+        # Build enriched insider digest; warm the T212 instrument list meanwhile so ticker
+        # resolution doesn't stall the first order on a full metadata download
+        digest, _ = await asyncio.gather(
+            self.build_insider_digest(),
+            self._prefetch_instruments(t212),
+        )
         insider_count = digest.get("insider_count", 0)
 
         if insider_count < self._settings.min_insider_tickers:
@@ -384,28 +419,32 @@ class Supervisor:
             path=self._settings.recently_traded_path,
             days=self._settings.recently_traded_days,
         )
-        all_candidates = digest.get("candidates", [])
-        blacklisted = [c["ticker"] for c in all_candidates if c["ticker"] in blacklist]
-        filtered = [c for c in all_candidates if c["ticker"] not in blacklist]
+        # Single pass: bucket each candidate as blacklisted, politician or insider
+        ct_enabled = self._settings.capitol_trades_enabled
+        blacklisted: list[str] = []
+        insider_pool: list[dict] = []
+        politician_pool: list[dict] = []
+        for c in digest.get("candidates", []):
+            if c["ticker"] in blacklist:
+                blacklisted.append(c["ticker"])
+            elif ct_enabled and c.get("source") == "capitol_trades":
+                politician_pool.append(c)
+            else:
+                insider_pool.append(c)
         if blacklisted:
             logger.info("Filtered %d blacklisted tickers: %s", len(blacklisted), blacklisted)
 
         # Pool-aware cap: guarantee Capitol Trades slots reach the research stage
-        if self._settings.capitol_trades_enabled:
-            insider_pool = [c for c in filtered if c.get("source") != "capitol_trades"]
-            politician_pool = [c for c in filtered if c.get("source") == "capitol_trades"]
-            reserved = self._settings.capitol_trades_reserved_slots
-            politician_slots = min(len(politician_pool), reserved)
-            insider_slots = self._settings.research_top_n - politician_slots
-            capped = politician_pool[:politician_slots] + insider_pool[:insider_slots]
-        else:
-            capped = filtered[: self._settings.research_top_n]
+        politician_slots = min(len(politician_pool), self._settings.capitol_trades_reserved_slots)
+        insider_slots = self._settings.research_top_n - politician_slots
+        capped = politician_pool[:politician_slots] + insider_pool[:insider_slots]
 
         digest["candidates"] = capped
-        if len(filtered) > self._settings.research_top_n:
+        filtered_count = len(insider_pool) + len(politician_pool)
+        if filtered_count > self._settings.research_top_n:
             logger.info(
                 "Capped candidates from %d to %d for research stage",
-                len(filtered),
+                filtered_count,
                 self._settings.research_top_n,
             )
 
@@ -471,19 +510,25 @@ class Supervisor:
 
     async def _picks_to_candidates(self, picks: PickReview) -> list[dict]:
         self._ensure_clients()
-        buy_picks = sorted(
-            [p for p in picks.picks if p.action == "buy"],
+        buy_picks = heapq.nlargest(
+            self._settings.max_picks_per_run,
+            (p for p in picks.picks if p.action == "buy"),
             key=lambda p: p.allocation_pct,
-            reverse=True,
         )
-        buy_picks = buy_picks[: self._settings.max_picks_per_run]
 
-        eur_usd = await get_eur_usd_rate()
+        # Price probes are independent of each other and of the FX rate; a ticker the
+        # model picked twice is only priced once
+        tickers = list(dict.fromkeys(p.ticker for p in buy_picks))
+        eur_usd, *quotes = await asyncio.gather(
+            get_eur_usd_rate(),
+            *(self._fetch_price(t) for t in tickers),
+        )
         logger.info("EUR/USD rate for order sizing: %.4f", eur_usd)
+        quote_by_ticker = dict(zip(tickers, quotes, strict=True))
 
         candidates: list[dict] = []
         for pick in buy_picks:
-            price, currency = await self._fetch_price(pick.ticker)
+            price, currency = quote_by_ticker[pick.ticker]
             if price <= 0:
                 logger.warning("No price for %s — excluded from execution", pick.ticker)
                 continue
@@ -517,13 +562,12 @@ class Supervisor:
         return result
 
     async def _fetch_price(self, ticker: str) -> tuple[float, str]:
-        """Returns (price, currency) where price is in the stock's native currency."""
-        self._ensure_clients()
+        """Returns (price, currency) where price is in the stock's native currency.
+
+        Expects the caller to have run _ensure_clients once for the whole batch.
+        """
         try:
-            price_resp = await asyncio.wait_for(
-                self._market_data_client.call_tool("get_stock_price", {"ticker": ticker}),
-                timeout=15.0,
-            )
+            price_resp = await self._get_stock_price(ticker)
         except TimeoutError:
             logger.warning("Price fetch timed out for %s", ticker)
             price_resp = {}
@@ -531,16 +575,29 @@ class Supervisor:
         currency = price_resp.get("currency", "USD") if isinstance(price_resp, dict) else "USD"
         return price, currency
 
+    # One retry on a timeout: a pick without a price is dropped from execution entirely
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_random_exponential(multiplier=0.5, max=2),
+        retry=retry_if_exception_type(TimeoutError),
+        reraise=True,
+        before_sleep=lambda rs: logger.warning(
+            "Price fetch timed out for %s — retrying", rs.args[1]
+        ),
+    )
+    async def _get_stock_price(self, ticker: str) -> dict:
+        return await asyncio.wait_for(
+            self._market_data_client.call_tool("get_stock_price", {"ticker": ticker}),
+            timeout=15.0,
+        )
+
     async def run_end_of_day(self, run_date: date | None = None) -> dict:
-        run_date = run_date or datetime.now(ZoneInfo(self._settings.orchestrator_timezone)).date()
+        run_date = run_date or self._today()
         t212 = self._get_t212()
-        positions: list[dict] = []
-        try:
-            positions = await get_demo_positions(t212)
-        except Exception:
-            logger.exception("Failed to fetch demo positions for EOD snapshot")
-
-        account_cash = await self._get_account_cash_snapshot(t212)
+        positions, account_cash = await asyncio.gather(
+            self._get_demo_positions_snapshot(t212),
+            self._get_account_cash_snapshot(t212),
+        )
         total_invested, total_value, unrealized_pnl = self._resolve_portfolio_totals(
             positions=positions,
             account_cash=account_cash,
@@ -549,13 +606,7 @@ class Supervisor:
         return {
             "status": "ok",
             "date": str(run_date),
-            "snapshots": {
-                "demo": {
-                    "total_invested": str(round(Decimal(str(total_invested)), 2)),
-                    "total_value": str(round(Decimal(str(total_value)), 2)),
-                    "unrealized_pnl": str(round(Decimal(str(unrealized_pnl)), 2)),
-                }
-            },
+            "snapshots": {"demo": _format_totals(total_invested, total_value, unrealized_pnl)},
             "demo_positions": positions,
         }
 
@@ -567,8 +618,8 @@ class Supervisor:
         if val is None:
             return 0.0
         try:
-            return float(Decimal(str(val)))
-        except (InvalidOperation, ValueError):
+            return float(val)
+        except (TypeError, ValueError):
             return 0.0
 
     @staticmethod
@@ -583,6 +634,19 @@ class Supervisor:
             total_value += qty * Decimal(str(current)) if current > 0 else qty * avg
         return total_invested, total_value
 
+    async def _prefetch_instruments(self, t212: T212Client) -> None:
+        try:
+            await t212.get_instruments()
+        except Exception:
+            logger.warning("Could not prefetch T212 instruments", exc_info=True)
+
+    async def _get_demo_positions_snapshot(self, t212: T212Client) -> list[dict]:
+        try:
+            return await get_demo_positions(t212)
+        except Exception:
+            logger.exception("Failed to fetch demo positions")
+            return []
+
     async def _get_account_cash_snapshot(self, t212: T212Client) -> dict:
         try:
             return await get_account_cash(t212)
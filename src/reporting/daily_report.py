@@ -4,6 +4,8 @@ from pathlib import Path
 
 from src.config import get_settings
 
+_OPEN_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
 
 def _fmt_eur(value: float | str) -> str:
     try:
@@ -17,16 +19,16 @@ def _fmt_pct(value: float) -> str:
     return f"{sign}{value:.1f}%"
 
 
-def _days_held(pos: dict) -> str:
+def _days_held(pos: dict, today: date) -> str:
     open_date = pos.get("open_date") or pos.get("opened_at", "")
     if not open_date:
         return "—"
-    match = re.match(r"(\d{4}-\d{2}-\d{2})", str(open_date))
+    match = _OPEN_DATE_RE.match(str(open_date))
     if not match:
         return "—"
     try:
         opened = date.fromisoformat(match.group(1))
-        return str((date.today() - opened).days)
+        return str((today - opened).days)
     except ValueError:
         return "—"
 
@@ -142,6 +144,7 @@ async def generate_daily_report(
         lines.append("")
         lines.append("| Ticker | Bought at | Now | P&L | Days held |")
         lines.append("|--------|-----------|-----|-----|-----------|")
+        today = date.today()
         for pos in sorted(demo_positions, key=lambda p: p.get("ticker", "")):
             ticker = pos.get("ticker", "?")
             try:
@@ -150,7 +153,7 @@ async def generate_daily_report(
             except (TypeError, ValueError):
                 avg, current = 0.0, 0.0
             return_pct = _position_return(pos)
-            days = _days_held(pos)
+            days = _days_held(pos, today)
             avg_str = _fmt_eur(avg) if avg > 0 else "—"
             current_str = _fmt_eur(current) if current > 0 else "—"
             pnl_str = _fmt_pct(return_pct) if avg > 0 and current > 0 else "—"
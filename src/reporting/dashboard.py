@@ -2,6 +2,7 @@ import json
 import logging
 import re
 import subprocess
+import threading
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -9,6 +10,10 @@ logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = Path(__file__).parent.parent.parent
 _DATA_FILE = _PROJECT_ROOT / "docs" / "data.json"
+_OPEN_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+# Held across a data.json read-modify-write and its git push; jobs call these from worker threads
+DATA_LOCK = threading.Lock()
 
 
 def _read_data() -> dict:
@@ -31,21 +36,22 @@ def _read_data() -> dict:
     }
 
 
-def _days_held(pos: dict) -> int:
+def _days_held(pos: dict, today: date) -> int:
     raw = pos.get("open_date") or pos.get("opened_at", "")
     if not raw:
         return 0
-    match = re.match(r"(\d{4}-\d{2}-\d{2})", str(raw))
+    match = _OPEN_DATE_RE.match(str(raw))
     if not match:
         return 0
     try:
-        return (date.today() - date.fromisoformat(match.group(1))).days
+        return (today - date.fromisoformat(match.group(1))).days
     except ValueError:
         return 0
 
 
 def _build_positions(demo_positions: list[dict]) -> list[dict]:
     positions = []
+    today = date.today()
     for pos in demo_positions:
         ticker = pos.get("ticker", "")
         if not ticker:
@@ -72,7 +78,7 @@ def _build_positions(demo_positions: list[dict]) -> list[dict]:
                 "current_value_eur": value,
                 "pnl_eur": pnl_eur,
                 "pnl_pct": pnl_pct,
-                "days_held": _days_held(pos),
+                "days_held": _days_held(pos, today),
             }
         )
     return positions
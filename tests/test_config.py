@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 from src.config import Settings
 
@@ -22,6 +23,7 @@ class TestSettings:
         assert settings.budget_per_run_eur == 1000.0
         assert settings.max_picks_per_run == 5
         assert settings.insider_top_n == 25
+        assert settings.news_max_concurrency == 5
         assert settings.research_top_n == 15
         assert settings.recently_traded_days == 3
         assert settings.claude_sonnet_model == "claude-sonnet-4-6"
@@ -33,6 +35,35 @@ class TestSettings:
         assert settings.telegram_bot_token is None
         assert settings.telegram_enabled is False
 
+    def test_schedule_times_parsed(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "x")
+        monkeypatch.setenv("T212_API_KEY", "x")
+        monkeypatch.setenv("SCHEDULER_SNAPSHOT_TIMES", " 10:00, ,15:30 ")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.execute_time_parsed == (17, 10)
+        assert settings.eod_time_parsed == (17, 35)
+        assert settings.snapshot_times_parsed == ((10, 0), (15, 30))
+
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_invalid_news_max_concurrency_raises(self, monkeypatch, value):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "x")
+        monkeypatch.setenv("T212_API_KEY", "x")
+        monkeypatch.setenv("NEWS_MAX_CONCURRENCY", value)
+
+        with pytest.raises(ValidationError, match="news_max_concurrency"):
+            Settings(_env_file=None)
+
+    @pytest.mark.parametrize("value", ["1710", "25:00", "17:xx", "", "17:10,18:00"])
+    def test_invalid_schedule_time_raises(self, monkeypatch, value):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "x")
+        monkeypatch.setenv("T212_API_KEY", "x")
+        monkeypatch.setenv("SCHEDULER_EXECUTE_TIME", value)
+
+        with pytest.raises(ValidationError, match="expected HH:MM"):
+            Settings(_env_file=None)
+
     def test_missing_required_key_raises(self, monkeypatch):
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
         monkeypatch.delenv("T212_API_KEY", raising=False)
@@ -2,6 +2,8 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
+import httpx
+import pandas as pd
 import pytest
 
 from src.mcp_servers.market_data.finance import (
@@ -10,10 +12,13 @@ from src.mcp_servers.market_data.finance import (
     compute_macd,
     compute_moving_averages,
     compute_rsi,
+    get_price_returns_for_ticker,
+    get_price_snapshot,
     get_ticker_fundamentals,
     get_ticker_info,
     is_eu_market_open,
 )
+from src.mcp_servers.market_data.insider import get_ticker_insider_history
 
 # --- EMA ---
 
@@ -270,3 +275,87 @@ class TestGetTickerFundamentals:
             assert result["sector"] == "Technology"
             assert result["pe_ratio"] == 28.5
             assert result["market_cap"] == 250_000_000_000
+
+
+class TestGetPriceSnapshot:
+    @pytest.mark.asyncio
+    async def test_returns_and_technicals_from_one_history(self):
+        index = pd.date_range(end="2026-02-17", periods=366, freq="D", tz="America/New_York")
+        closes = [100.0 + i for i in range(366)]
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame({"Close": closes}, index=index)
+
+        with patch("src.mcp_servers.market_data.finance.yf.Ticker", return_value=mock_ticker):
+            result = await get_price_snapshot("SAP.DE")
+
+        mock_ticker.history.assert_called_once_with(period="1y")
+        assert result["returns"]["return_1m"] == pytest.approx(round(30 / 435, 4))
+        assert result["returns"]["return_1y"] == pytest.approx(round(365 / 100, 4))
+        assert result["technicals"]["data_points"] == 183
+        assert result["technicals"]["current_price"] == 465.0
+
+    @pytest.mark.asyncio
+    async def test_empty_history(self):
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame({"Close": []})
+
+        with patch("src.mcp_servers.market_data.finance.yf.Ticker", return_value=mock_ticker):
+            result = await get_price_snapshot("NOPE")
+
+        assert result["returns"] == {"return_1m": None, "return_6m": None, "return_1y": None}
+        assert "error" in result["technicals"]
+
+
+class TestGetPriceReturnsForTicker:
+    @pytest.mark.asyncio
+    async def test_returns_from_one_history(self):
+        index = pd.date_range(end="2026-02-17", periods=366, freq="D", tz="America/New_York")
+        closes = [100.0 + i for i in range(366)]
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame({"Close": closes}, index=index)
+
+        with patch("src.mcp_servers.market_data.finance.yf.Ticker", return_value=mock_ticker):
+            result = await get_price_returns_for_ticker("SAP.DE")
+
+        mock_ticker.history.assert_called_once_with(period="1y")
+        assert set(result) == {"return_1m", "return_6m", "return_1y"}
+        assert result["return_1m"] == pytest.approx(round(30 / 435, 4))
+        assert result["return_1y"] == pytest.approx(round(365 / 100, 4))
+
+    @pytest.mark.asyncio
+    async def test_empty_history(self):
+        mock_ticker = MagicMock()
+        mock_ticker.history.return_value = pd.DataFrame({"Close": []})
+
+        with patch("src.mcp_servers.market_data.finance.yf.Ticker", return_value=mock_ticker):
+            result = await get_price_returns_for_ticker("NOPE")
+
+        assert result == {"return_1m": None, "return_6m": None, "return_1y": None}
+
+
+def _openinsider_client() -> httpx.Client:
+    return httpx.Client(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<html></html>"))
+    )
+
+
+class TestGetTickerInsiderHistory:
+    @pytest.mark.asyncio
+    async def test_shared_client_is_left_open(self):
+        client = _openinsider_client()
+
+        result = await get_ticker_insider_history("ACME", client=client)
+
+        assert result["buys_90d"] == 0
+        assert not client.is_closed
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_own_client_is_closed(self):
+        client = _openinsider_client()
+
+        with patch("src.mcp_servers.market_data.insider.make_history_client", return_value=client):
+            result = await get_ticker_insider_history("ACME")
+
+        assert result["accelerating"] is False
+        assert client.is_closed
@@ -246,6 +246,23 @@ class TestT212Client:
         resolved = await client.resolve_ticker("XYZ.L")
         assert resolved is None
 
+    @pytest.mark.asyncio
+    async def test_resolve_ticker_sees_refreshed_instruments(self):
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.json.return_value = [{"ticker": "SAP_DE_EQ"}]
+        second_response = MagicMock()
+        second_response.status_code = 200
+        second_response.json.return_value = [{"ticker": "SAP_DE_EQ"}, {"ticker": "ASML_NL_EQ"}]
+
+        client = T212Client(api_key="test-key", api_secret="test-secret")
+        client._client = AsyncMock()
+        client._client.request = AsyncMock(side_effect=[first_response, second_response])
+
+        assert await client.resolve_ticker("SAP.DE") == "SAP_DE_EQ"
+        await client.get_instruments(force_refresh=True)
+        assert await client.resolve_ticker("ASML.AS") == "ASML_NL_EQ"
+
 
 class TestTradingServerOrders:
     @pytest.mark.asyncio
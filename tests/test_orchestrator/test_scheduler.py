@@ -1,46 +1,194 @@
-from types import SimpleNamespace
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
+from src.config import Settings
 from src.orchestrator.scheduler import OrchestratorScheduler
 
 
 class _DummySupervisor:
-    async def collect_reddit_round(self):
-        return {"status": "ok"}
+    def __init__(self):
+        self.decision_calls = 0
+        self.t212 = object()
+        self.closed = False
 
-    async def run_decision_cycle(self, require_approval: bool = True):
-        return {"status": "ok", "require_approval": require_approval}
+    async def run_decision_cycle(self):
+        self.decision_calls += 1
+        return {"status": "ok"}
 
     async def run_end_of_day(self):
-        return {"status": "ok"}
+        return {"status": "ok", "date": "2026-02-17", "demo_positions": []}
+
+    async def close(self):
+        self.closed = True
+
+
+def _settings(monkeypatch, snapshot_times: str = "10:00, 15:30") -> Settings:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "x")
+    monkeypatch.setenv("T212_API_KEY", "x")
+    monkeypatch.setenv("SCHEDULER_SNAPSHOT_TIMES", snapshot_times)
+    return Settings(_env_file=None)
 
 
 class TestOrchestratorScheduler:
-    def test_configure_jobs(self):
-        settings = SimpleNamespace(
-            orchestrator_timezone="Europe/Berlin",
-            scheduler_collect_times="08:00,12:00,16:30",
-            scheduler_execute_time="17:10",
-            scheduler_eod_time="17:35",
-            sell_check_schedule="09:30,12:30,16:45",
-            signal_candidate_limit=25,
-            screener_min_market_cap=1_000_000_000,
-            screener_exchanges="AMS,PAR,GER,MIL,MCE,LSE",
-            max_tool_rounds=10,
-            pipeline_timeout_seconds=600,
+    def test_configure_jobs(self, monkeypatch):
+        scheduler = OrchestratorScheduler(
+            supervisor=_DummySupervisor(), settings=_settings(monkeypatch)
         )
-        scheduler = OrchestratorScheduler(supervisor=_DummySupervisor(), settings=settings)
         scheduler.configure_jobs()
 
         jobs = scheduler.scheduler.get_jobs()
         job_ids = sorted(job.id for job in jobs)
 
         assert job_ids == [
-            "collect_round_1",
-            "collect_round_2",
-            "collect_round_3",
             "decision_and_execution",
             "end_of_day_snapshot",
-            "sell_check_1",
-            "sell_check_2",
-            "sell_check_3",
+            "portfolio_snapshot_0",
+            "portfolio_snapshot_1",
         ]
+        decision = scheduler.scheduler.get_job("decision_and_execution")
+        assert str(decision.trigger) == "cron[day_of_week='tue,fri', hour='17', minute='10']"
+        assert decision.misfire_grace_time == 60
+        assert scheduler.scheduler.get_job("end_of_day_snapshot").misfire_grace_time == 3600
+
+    def test_snapshot_times_sharing_a_minute_use_one_job(self, monkeypatch):
+        settings = _settings(monkeypatch, snapshot_times="10:00,12:00,15:30")
+        scheduler = OrchestratorScheduler(supervisor=_DummySupervisor(), settings=settings)
+        scheduler.configure_jobs()
+
+        on_the_hour = scheduler.scheduler.get_job("portfolio_snapshot_0")
+        half_past = scheduler.scheduler.get_job("portfolio_snapshot_1")
+        assert str(on_the_hour.trigger) == "cron[day_of_week='mon-fri', hour='10,12', minute='0']"
+        assert str(half_past.trigger) == "cron[day_of_week='mon-fri', hour='15', minute='30']"
+        assert scheduler.scheduler.get_job("portfolio_snapshot_2") is None
+
+    def test_snapshot_hours_are_deduplicated_and_sorted(self, monkeypatch):
+        settings = _settings(monkeypatch, snapshot_times="15:00,10:00,10:00")
+        scheduler = OrchestratorScheduler(supervisor=_DummySupervisor(), settings=settings)
+        scheduler.configure_jobs()
+
+        job = scheduler.scheduler.get_job("portfolio_snapshot_0")
+        assert str(job.trigger) == "cron[day_of_week='mon-fri', hour='10,15', minute='0']"
+
+    def test_configure_jobs_is_idempotent(self, monkeypatch):
+        scheduler = OrchestratorScheduler(
+            supervisor=_DummySupervisor(), settings=_settings(monkeypatch)
+        )
+        scheduler.configure_jobs()
+        scheduler.configure_jobs()
+
+        assert len(scheduler.scheduler.get_jobs()) == 4
+
+    @pytest.mark.asyncio
+    async def test_eod_report_failure_does_not_cancel_dashboard(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        scheduler = OrchestratorScheduler(
+            supervisor=_DummySupervisor(), settings=_settings(monkeypatch)
+        )
+        update = MagicMock()
+        push = MagicMock()
+
+        with (
+            patch(
+                "src.orchestrator.scheduler.generate_daily_report",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ),
+            patch("src.reporting.dashboard.update_dashboard_data", update),
+            patch("src.reporting.dashboard.push_dashboard_data", push),
+        ):
+            await scheduler._run_eod_job()
+
+        update.assert_called_once()
+        push.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_jobs_skip_on_non_trading_day(self, monkeypatch):
+        supervisor = _DummySupervisor()
+        scheduler = OrchestratorScheduler(supervisor=supervisor, settings=_settings(monkeypatch))
+        refresh = MagicMock()
+
+        with (
+            patch("src.orchestrator.scheduler.is_trading_day", return_value=False),
+            patch("src.reporting.dashboard.refresh_portfolio_snapshot", refresh),
+        ):
+            await scheduler._run_decision_job()
+            await scheduler._run_snapshot_job()
+
+        assert supervisor.decision_calls == 0
+        refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_job_uses_supervisor_t212_client(self, monkeypatch):
+        supervisor = _DummySupervisor()
+        scheduler = OrchestratorScheduler(supervisor=supervisor, settings=_settings(monkeypatch))
+        get_positions = AsyncMock(return_value=[])
+
+        with (
+            patch("src.orchestrator.scheduler.is_trading_day", return_value=True),
+            patch("src.mcp_servers.trading.portfolio.get_demo_positions", get_positions),
+            patch("src.mcp_servers.trading.portfolio.get_account_cash", AsyncMock(return_value={})),
+            patch("src.reporting.dashboard.refresh_portfolio_snapshot", MagicMock()),
+            patch("src.reporting.dashboard.push_dashboard_data", MagicMock()),
+        ):
+            await scheduler._run_snapshot_job()
+            await scheduler._run_snapshot_job()
+
+        clients = [call.args[0] for call in get_positions.await_args_list]
+        assert clients == [supervisor.t212, supervisor.t212]
+
+        await scheduler.close()
+        assert supervisor.closed
+
+    @pytest.mark.asyncio
+    async def test_eod_report_written_once_per_day(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        scheduler = OrchestratorScheduler(
+            supervisor=_DummySupervisor(), settings=_settings(monkeypatch)
+        )
+        generate = AsyncMock(return_value="# report")
+
+        with (
+            patch("src.orchestrator.scheduler.generate_daily_report", generate),
+            patch("src.reporting.dashboard.update_dashboard_data", MagicMock()),
+            patch("src.reporting.dashboard.push_dashboard_data", MagicMock()),
+        ):
+            await scheduler._run_eod_job()
+            await scheduler._run_eod_job()
+
+        generate.assert_awaited_once()
+        assert (tmp_path / "reports" / "2026-02-17.md").read_text() == "# report"
+
+    @pytest.mark.asyncio
+    async def test_eod_and_snapshot_dashboard_writes_do_not_interleave(self, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        scheduler = OrchestratorScheduler(
+            supervisor=_DummySupervisor(), settings=_settings(monkeypatch)
+        )
+        calls: list[str] = []
+
+        def _step(name):
+            def _run(*args, **kwargs):
+                calls.append(name)
+                time.sleep(0.05)
+
+            return _run
+
+        with (
+            patch("src.orchestrator.scheduler.is_trading_day", return_value=True),
+            patch("src.orchestrator.scheduler.generate_daily_report", AsyncMock(return_value="")),
+            patch(
+                "src.mcp_servers.trading.portfolio.get_demo_positions", AsyncMock(return_value=[])
+            ),
+            patch("src.mcp_servers.trading.portfolio.get_account_cash", AsyncMock(return_value={})),
+            patch("src.reporting.dashboard.update_dashboard_data", _step("update")),
+            patch("src.reporting.dashboard.refresh_portfolio_snapshot", _step("refresh")),
+            patch("src.reporting.dashboard.push_dashboard_data", _step("push")),
+        ):
+            await asyncio.gather(scheduler._run_eod_job(), scheduler._run_snapshot_job())
+
+        assert calls in (
+            ["update", "push", "refresh", "push"],
+            ["refresh", "push", "update", "push"],
+        )
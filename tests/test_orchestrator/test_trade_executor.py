@@ -1,9 +1,11 @@
+from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 
-from src.orchestrator.supervisor import Supervisor
+from src.models import PickReview, StockPick
+from src.orchestrator.supervisor import Supervisor, _format_totals
 from src.orchestrator.trade_executor import execute_with_fallback
 
 
@@ -70,6 +72,14 @@ async def test_run_decision_cycle_skips_when_portfolio_cap_is_reached(monkeypatc
     supervisor.build_insider_digest.assert_not_awaited()
 
 
+def test_format_totals_rounds_the_decimal_repr():
+    assert _format_totals(2.675, 1100.0, 0.0) == {
+        "total_invested": "2.68",
+        "total_value": "1100.00",
+        "unrealized_pnl": "0.00",
+    }
+
+
 def test_resolve_portfolio_totals_prefers_account_cash():
     positions = [
         {"ticker": "X", "quantity": 10.0, "avg_buy_price": 1000.0, "current_price": 1100.0},
@@ -94,3 +104,97 @@ def test_resolve_portfolio_totals_falls_back_to_positions():
     assert invested == pytest.approx(100.0)
     assert value == pytest.approx(120.0)
     assert pnl == pytest.approx(20.0)
+
+
+def test_compute_portfolio_totals_keeps_exact_decimals():
+    positions = [
+        {"ticker": "X", "quantity": 0.5, "avg_buy_price": 10.03, "current_price": 0.0},
+    ]
+    invested, value = Supervisor._compute_portfolio_totals(positions)
+    assert invested == value == Decimal("5.015")
+    assert _format_totals(float(invested), float(value), 0.0)["total_invested"] == "5.02"
+
+
+@pytest.mark.asyncio
+async def test_picks_to_candidates_prices_each_pick_in_order(monkeypatch):
+    class _PriceClient:
+        async def call_tool(self, name: str, arguments: dict) -> dict:
+            prices = {
+                "ASML": {"price": 110.0, "currency": "USD"},
+                "SAP.DE": {"price": 50.0, "currency": "EUR"},
+            }
+            return prices.get(arguments["ticker"], {})
+
+    settings = SimpleNamespace(max_picks_per_run=5)
+    supervisor = Supervisor(
+        settings=settings, trading_client=object(), market_data_client=_PriceClient()
+    )
+    monkeypatch.setattr("src.orchestrator.supervisor.get_eur_usd_rate", AsyncMock(return_value=1.1))
+    picks = PickReview(
+        picks=[
+            StockPick(ticker="SAP.DE", allocation_pct=30.0),
+            StockPick(ticker="NOPRICE", allocation_pct=20.0),
+            StockPick(ticker="ASML", allocation_pct=50.0),
+        ]
+    )
+
+    candidates = await supervisor._picks_to_candidates(picks)
+
+    assert [c["ticker"] for c in candidates] == ["ASML", "SAP.DE"]
+    assert candidates[0]["price"] == pytest.approx(100.0)
+    assert candidates[1]["price"] == pytest.approx(50.0)
+
+
+@pytest.mark.asyncio
+async def test_picks_to_candidates_prices_duplicate_ticker_once(monkeypatch):
+    market_data = AsyncMock()
+    market_data.call_tool = AsyncMock(return_value={"price": 10.0, "currency": "EUR"})
+    supervisor = Supervisor(
+        settings=SimpleNamespace(max_picks_per_run=5),
+        trading_client=object(),
+        market_data_client=market_data,
+    )
+    monkeypatch.setattr("src.orchestrator.supervisor.get_eur_usd_rate", AsyncMock(return_value=1.1))
+    picks = PickReview(
+        picks=[
+            StockPick(ticker="ASML", allocation_pct=60.0),
+            StockPick(ticker="ASML", allocation_pct=40.0),
+        ]
+    )
+
+    candidates = await supervisor._picks_to_candidates(picks)
+
+    assert len(candidates) == 2
+    market_data.call_tool.assert_awaited_once_with("get_stock_price", {"ticker": "ASML"})
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        ({"price": 12.5}, 12.5),
+        ({"price": "12.5"}, 12.5),
+        ({"price": None}, 0.0),
+        ({"price": "n/a"}, 0.0),
+        ({"price": {"value": 1}}, 0.0),
+        ({"error": "not found"}, 0.0),
+        ("not a dict", 0.0),
+    ],
+)
+def test_extract_price(payload, expected):
+    assert Supervisor._extract_price(payload) == expected
+
+
+@pytest.mark.asyncio
+async def test_fetch_price_retries_once_after_timeout():
+    market_data = AsyncMock()
+    market_data.call_tool = AsyncMock(
+        side_effect=[TimeoutError(), {"price": 42.0, "currency": "EUR"}]
+    )
+    supervisor = Supervisor(
+        settings=SimpleNamespace(),
+        trading_client=object(),
+        market_data_client=market_data,
+    )
+
+    assert await supervisor._fetch_price("ASML") == (42.0, "EUR")
+    assert market_data.call_tool.await_count == 2
@@ -27,3 +27,40 @@ def test_refresh_portfolio_snapshot_uses_account_cash_totals(tmp_path, monkeypat
     assert portfolio["unrealized_pnl_eur"] == -42.23
     assert portfolio["total_value_eur"] == 30876.57
     assert len(portfolio["positions"]) == 1
+
+
+def test_refresh_portfolio_snapshot_falls_back_to_position_totals(tmp_path, monkeypatch):
+    data_file = tmp_path / "data.json"
+    monkeypatch.setattr(dashboard, "_DATA_FILE", data_file)
+    monkeypatch.setattr(dashboard, "_compute_sp100_history", lambda data: [])
+
+    demo_positions = [
+        {"ticker": "A_US_EQ", "quantity": 10.0, "avg_buy_price": 20.0, "current_price": 22.0},
+        {"ticker": "B_US_EQ", "quantity": 5.0, "avg_buy_price": 10.0, "current_price": 0.0},
+    ]
+
+    dashboard.refresh_portfolio_snapshot(demo_positions, account_cash=None)
+
+    portfolio = json.loads(data_file.read_text())["portfolio"]
+    assert portfolio["total_invested_eur"] == 250.0
+    assert portfolio["total_value_eur"] == 270.0
+    assert portfolio["unrealized_pnl_eur"] == 20.0
+
+
+def test_build_run_entry_totals_only_filled_executions():
+    decision_result = {
+        "date": "2026-04-07",
+        "picks": [
+            {"ticker": "ASML", "allocation_pct": 60.0},
+            {"ticker": "SAP", "allocation_pct": 40.0},
+        ],
+        "execution": [
+            {"status": "filled", "ticker": "ASML", "amount_eur": 600.0, "quantity": 1.0},
+            {"status": "failed", "ticker": "SAP", "error": "no price"},
+        ],
+    }
+
+    entry = dashboard._build_run_entry(decision_result, run_number=1)
+
+    assert entry["total_spent_eur"] == 600.0
+    assert [p["executed"] for p in entry["picks"]] == [True, False]